@@ -23,5 +23,5 @@ audio = m.generate(text=text, voice=voice )
 
 # Save the audio
 import soundfile as sf
-sf.write('output.wav', audio, 24000)
+sf.write('output.wav', audio, m.sample_rate)
 print(f"Audio saved to output.wav")
\ No newline at end of file
@@ -1,15 +1,17 @@
-import numpy as np
+import queue
+import threading
+
 import soundfile as sf
 from kittentts import KittenTTS
 
-SAMPLE_RATE = 24000
-
 # Step 1: Load the model
 m = KittenTTS("KittenML/kitten-tts-mini-0.8")  # 80M version (highest quality)
 # m = KittenTTS("KittenML/kitten-tts-mini-0.8", backend="cuda")  # GPU version
 # m = KittenTTS("KittenML/kitten-tts-micro-0.8")  # 40M version
 # m = KittenTTS("KittenML/kitten-tts-nano-0.8")  # 15M version (tiny and faster)
 
+SAMPLE_RATE = m.sample_rate
+
 # Step 2: Define text and voice
 text = """One day, a little girl named Lily found a needle in her room. She knew it was difficult to play with it because it was sharp. Lily wanted to use the needle to sew a button on her shirt. She asked her mom for help."""
 
@@ -23,17 +25,40 @@ except (ImportError, OSError):
     has_audio = False
 
 # Step 3: Stream audio chunk by chunk
+# Generation runs in a background thread so the next chunk is synthesized
+# while the current one plays. A single low-latency output stream avoids
+# the start-up delay sd.play() pays per chunk.
 print("Streaming audio...")
-chunks = []
-for i, chunk in enumerate(m.generate_stream(text=text, voice=voice)):
-    audio = chunk.squeeze()
-    chunks.append(audio)
-    print(f"  Chunk {i + 1}: {len(audio)} samples ({len(audio) / SAMPLE_RATE:.2f}s)")
-    if has_audio:
-        sd.play(audio, samplerate=SAMPLE_RATE)
-        sd.wait()
-
-# Save the full audio
-full_audio = np.concatenate(chunks)
-sf.write("output_streaming.wav", full_audio, SAMPLE_RATE)
-print(f"Audio saved to output_streaming.wav ({len(full_audio) / SAMPLE_RATE:.2f}s total)")
+audio_queue = queue.Queue(maxsize=2)
+
+
+def produce():
+    try:
+        for chunk in m.generate_stream(text=text, voice=voice):
+            audio_queue.put(chunk.squeeze())
+    finally:
+        audio_queue.put(None)
+
+
+threading.Thread(target=produce, daemon=True).start()
+
+# Each chunk is also appended to the output file as it arrives, so the full
+# audio is never held in memory
+stream = None
+if has_audio:
+    stream = sd.OutputStream(samplerate=SAMPLE_RATE, channels=1, dtype="float32", latency="low")
+    stream.start()
+num_chunks = 0
+with sf.SoundFile("output_streaming.wav", mode="w", samplerate=SAMPLE_RATE, channels=1) as out:
+    while (audio := audio_queue.get()) is not None:
+        num_chunks += 1
+        print(f"  Chunk {num_chunks}: {len(audio)} samples ({len(audio) / SAMPLE_RATE:.2f}s)")
+        if stream is not None:
+            stream.write(audio)
+        out.write(audio)
+    total_frames = out.frames
+if stream is not None:
+    stream.stop()
+    stream.close()
+
+print(f"Audio saved to output_streaming.wav ({total_frames / SAMPLE_RATE:.2f}s total)")
@@ -1,3 +0,0 @@
-from kittentts.get_model import get_model
-
-    
\ No newline at end of file
@@ -1,18 +1,26 @@
 import json
+import logging
 import os
-from huggingface_hub import hf_hub_download
-from .onnx_model import KittenTTS_1_Onnx
+from concurrent.futures import ThreadPoolExecutor
+from .onnx_model import _CACHE_DIR, KittenTTS_1_Onnx, _model_cache_key
+
+logger = logging.getLogger(__name__)
 
 
 class KittenTTS:
     """Main KittenTTS class for text-to-speech synthesis."""
     
-    def __init__(self, model_name="KittenML/kitten-tts-nano-0.8", cache_dir=None, backend=None):
+    def __init__(self, model_name="KittenML/kitten-tts-nano-0.8", cache_dir=None, backend=None, intra_op_num_threads=None,
+                 quantize=None, sess_options=None, warm_up=False):
         """Initialize KittenTTS with a model from Hugging Face.
         
         Args:
             model_name: Hugging Face repository ID or model name
             cache_dir: Directory to cache downloaded files
+            intra_op_num_threads: ONNX Runtime intra-op thread count (None = up to 4)
+            quantize: Set to "int8" to dynamically quantize the model weights on first load
+            sess_options: Custom onnxruntime.SessionOptions overriding the defaults
+            warm_up: If true, call warm_up() before returning
         """
         # Handle different model name formats
         if "/" not in model_name:
@@ -21,7 +29,11 @@ class KittenTTS:
         else:
             repo_id = model_name
             
-        self.model = download_from_huggingface(repo_id=repo_id, cache_dir=cache_dir, backend=backend)
+        self.model = download_from_huggingface(repo_id=repo_id, cache_dir=cache_dir, backend=backend,
+                                               intra_op_num_threads=intra_op_num_threads, quantize=quantize,
+                                               sess_options=sess_options)
+        if warm_up:
+            self.warm_up()
     
     def generate(self, text, voice="expr-voice-5-m", speed=1.0, clean_text=False):
         """Generate audio from text.
@@ -34,18 +46,58 @@ class KittenTTS:
         Returns:
             Audio data as numpy array
         """
-        print(f"Generating audio for text: {text}")
+        logger.debug("Generating audio for text: %s", text)
         return self.model.generate(text, voice=voice, speed=speed, clean_text=clean_text)
 
-    def generate_stream(self, text, voice="expr-voice-5-m", speed=1.0, clean_text=False):
+    def generate_stream(self, text, voice="expr-voice-5-m", speed=1.0, clean_text=False, first_chunk_max_len=None):
         """Generate audio as a stream of chunks.
 
+        Args:
+            first_chunk_max_len: Optional smaller length limit for the first chunk,
+                so the first audio is ready sooner
+
         Yields:
             numpy.ndarray: Audio data for each text chunk.
         """
-        yield from self.model.generate_stream(text, voice=voice, speed=speed, clean_text=clean_text)
+        yield from self.model.generate_stream(text, voice=voice, speed=speed, clean_text=clean_text,
+                                              first_chunk_max_len=first_chunk_max_len)
+
+    def generate_batch(self, texts, voice="expr-voice-5-m", speed=1.0, clean_text=False, num_workers=None):
+        """Generate audio for several texts, phonemizing them in one pass.
+
+        Args:
+            texts: List of input texts to synthesize
+            voice: Voice to use for synthesis
+            speed: Speech speed (1.0 = normal)
+            num_workers: Number of worker processes (None = synthesize in this process)
+
+        Returns:
+            List of audio data numpy arrays, one per input text
+        """
+        return self.model.generate_batch(texts, voice=voice, speed=speed, clean_text=clean_text, num_workers=num_workers)
+
+    def phonemize(self, text, clean_text=False):
+        """Phonemize text once so it can be synthesized repeatedly with generate_from_phonemes().
+
+        Returns:
+            List of (text_chunk, phonemes) pairs
+        """
+        return self.model.phonemize(text, clean_text=clean_text)
+
+    def generate_from_phonemes(self, phonemized, voice="expr-voice-5-m", speed=1.0):
+        """Generate audio from the output of phonemize().
+
+        Args:
+            phonemized: Result of a previous phonemize() call
+            voice: Voice to use for synthesis
+            speed: Speech speed (1.0 = normal)
 
-    def generate_to_file(self, text, output_path, voice="expr-voice-5-m", speed=1.0, sample_rate=24000):
+        Returns:
+            Audio data as numpy array
+        """
+        return self.model.generate_from_phonemes(phonemized, voice=voice, speed=speed)
+
+    def generate_to_file(self, text, output_path, voice="expr-voice-5-m", speed=1.0, sample_rate=None):
         """Generate audio from text and save to file.
         
         Args:
@@ -53,26 +105,53 @@ class KittenTTS:
             output_path: Path to save the audio file
             voice: Voice to use for synthesis
             speed: Speech speed (1.0 = normal)
-            sample_rate: Audio sample rate
+            sample_rate: Audio sample rate (defaults to the model's sample rate)
         """
         return self.model.generate_to_file(text, output_path, voice=voice, speed=speed, sample_rate=sample_rate)
     
+    def warm_up(self, voice="expr-voice-5-m"):
+        """Run dummy syntheses so the first real generation is not slowed by cold start.
+
+        Safe to call repeatedly; only the first call does any work.
+        """
+        self.model.warm_up(voice=voice)
+
+    @property
+    def is_warm(self):
+        """Whether warm_up() has already run."""
+        return self.model.is_warm
+
+    def close(self):
+        """Release worker processes and the espeak backend; the model stays usable."""
+        self.model.close()
+
+    @property
+    def sample_rate(self):
+        """Sample rate of the generated audio in Hz."""
+        return self.model.sample_rate
+
     @property
     def available_voices(self):
         """Get list of available voices."""
         return self.model.all_voice_names
 
 
-def download_from_huggingface(repo_id="KittenML/kitten-tts-nano-0.1", cache_dir=None, backend=None):
+def download_from_huggingface(repo_id="KittenML/kitten-tts-nano-0.1", cache_dir=None, backend=None, intra_op_num_threads=None,
+                              quantize=None, sess_options=None):
     """Download model files from Hugging Face repository.
     
     Args:
         repo_id: Hugging Face repository ID
         cache_dir: Directory to cache downloaded files
+        intra_op_num_threads: ONNX Runtime intra-op thread count (None = up to 4)
+        quantize: Set to "int8" to dynamically quantize the model weights on first load
+        sess_options: Custom onnxruntime.SessionOptions overriding the defaults
         
     Returns:
         KittenTTS_1_Onnx: Instantiated model ready for use
     """
+    from huggingface_hub import hf_hub_download
+
     # Download config file first
     config_path = hf_hub_download(
         repo_id=repo_id,
@@ -87,25 +166,73 @@ def download_from_huggingface(repo_id="KittenML/kitten-tts-nano-0.1", cache_dir=
     if config.get("type") not in ["ONNX1", "ONNX2"]:
         raise ValueError("Unsupported model type.")
 
-    # Download model and voices files based on config
-    model_path = hf_hub_download(
-        repo_id=repo_id,
-        filename=config["model_file"],
-        cache_dir=cache_dir
-    )
-    
-    voices_path = hf_hub_download(
-        repo_id=repo_id,
-        filename=config["voices"],
-        cache_dir=cache_dir
-    )
+    if quantize not in (None, "int8"):
+        raise ValueError("Unsupported quantization.")
+
+    # Download model and voices files based on config, in parallel
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        model_future = pool.submit(hf_hub_download, repo_id=repo_id, filename=config["model_file"], cache_dir=cache_dir)
+        voices_future = pool.submit(hf_hub_download, repo_id=repo_id, filename=config["voices"], cache_dir=cache_dir)
+        model_path = model_future.result()
+        voices_path = voices_future.result()
+
+    if quantize == "int8":
+        model_path = quantize_model_int8(model_path)
     
     # Instantiate and return model
-    model = KittenTTS_1_Onnx(model_path=model_path, voices_path=voices_path, speed_priors=config.get("speed_priors", {}) , voice_aliases=config.get("voice_aliases", {}), backend=backend)
+    model = KittenTTS_1_Onnx(model_path=model_path, voices_path=voices_path, speed_priors=config.get("speed_priors", {}) , voice_aliases=config.get("voice_aliases", {}), backend=backend,
+                             intra_op_num_threads=intra_op_num_threads, sess_options=sess_options)
     
     return model
 
 
+def quantize_model_int8(model_path, output_dir=None):
+    """Dynamically quantize MatMul/Gemm weights of an ONNX model to int8.
+
+    The quantized model is cached, so only the first load pays the conversion.
+    The cache file is keyed on the source file's path, size and modification
+    time, so replacing the model triggers a new conversion.
+
+    Args:
+        model_path: Path to the FP32 ONNX model file
+        output_dir: Directory for quantized models (default: ~/.cache/kittentts)
+
+    Returns:
+        str: Path to the quantized ONNX model
+    """
+    if output_dir is None:
+        output_dir = _CACHE_DIR
+    stem = os.path.splitext(os.path.basename(model_path))[0]
+    quantized_path = os.path.join(output_dir, f"{stem}-{_model_cache_key(model_path)}.int8.onnx")
+    if os.path.exists(quantized_path):
+        return quantized_path
+
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError as e:
+        raise ImportError("int8 quantization requires the 'onnx' package: pip install onnx") from e
+
+    os.makedirs(output_dir, exist_ok=True)
+    # Write to a per-process temp file so concurrent first loads never publish a partial model
+    tmp_path = f"{quantized_path}.{os.getpid()}.tmp"
+    try:
+        quantize_dynamic(
+            model_path,
+            tmp_path,
+            weight_type=QuantType.QInt8,
+            op_types_to_quantize=["MatMul", "Gemm"],
+            per_channel=True,
+        )
+        os.replace(tmp_path, quantized_path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return quantized_path
+
+
 def get_model(repo_id="KittenML/kitten-tts-nano-0.1", cache_dir=None, backend=None):
     """Get a KittenTTS model (legacy function for backward compatibility)."""
     return KittenTTS(repo_id, cache_dir, backend=backend)
@@ -1,19 +1,45 @@
+import functools
+import hashlib
+import logging
+import multiprocessing
 import os
-import espeakng_loader
-from phonemizer.backend.espeak.wrapper import EspeakWrapper
-EspeakWrapper.set_library(espeakng_loader.get_library_path())
-os.environ['ESPEAK_DATA_PATH'] = espeakng_loader.get_data_path()
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import numpy as np
-import phonemizer
-import soundfile as sf
-import onnxruntime as ort
 from .preprocess import TextPreprocessor
 
+logger = logging.getLogger(__name__)
+
+_SENTENCE_END_RE = re.compile(r'[.!?]+')
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+# Intra-op threads used when none are requested. The model's ops are small,
+# so more threads mostly add synchronization overhead.
+_DEFAULT_INTRA_OP_THREADS = 4
+
+# Token count of the synthetic input run by warm_up(), about that of a full
+# 400-character chunk
+_WARM_UP_TOKENS = 400
+
+# Where models derived from the downloaded ones (optimized graphs, int8
+# weights) are cached
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "kittentts")
+
+# Execution providers tried by backend="auto", in order of preference
+_AUTO_PROVIDERS = [
+    "CUDAExecutionProvider",
+    "ROCMExecutionProvider",
+    "CoreMLExecutionProvider",
+    "DmlExecutionProvider",
+    "CPUExecutionProvider",
+]
+
 def basic_english_tokenize(text):
     """Basic English tokenizer that splits on whitespace and punctuation."""
-    import re
-    tokens = re.findall(r"\w+|[^\w\s]", text)
-    return tokens
+    return _TOKEN_RE.findall(text)
 
 def ensure_punctuation(text):
     """Ensure text ends with punctuation. If not, add a comma."""
@@ -25,11 +51,13 @@ def ensure_punctuation(text):
     return text
 
 
-def chunk_text(text, max_len=400):
-    """Split text into chunks for processing long texts."""
-    import re
-    
-    sentences = re.split(r'[.!?]+', text)
+def chunk_text(text, max_len=400, first_max_len=None):
+    """Split text into chunks for processing long texts.
+
+    If ``first_max_len`` is given, the first chunk is limited to that many
+    characters so streaming playback can start sooner.
+    """
+    sentences = _SENTENCE_END_RE.split(text)
     chunks = []
     
     for sentence in sentences:
@@ -37,25 +65,111 @@ def chunk_text(text, max_len=400):
         if not sentence:
             continue
         
-        if len(sentence) <= max_len:
+        if len(sentence) <= ((first_max_len or max_len) if not chunks else max_len):
             chunks.append(ensure_punctuation(sentence))
         else:
             # Split long sentences by words
+            # Collect words in a list and join once per chunk, avoiding
+            # quadratic string concatenation on very long sentences
             words = sentence.split()
-            temp_chunk = ""
+            buf = []
+            buf_len = 0
             for word in words:
-                if len(temp_chunk) + len(word) + 1 <= max_len:
-                    temp_chunk += " " + word if temp_chunk else word
+                limit = (first_max_len or max_len) if not chunks else max_len
+                if buf_len + len(word) + 1 <= limit:
+                    buf_len += len(word) + 1 if buf else len(word)
+                    buf.append(word)
                 else:
-                    if temp_chunk:
-                        chunks.append(ensure_punctuation(temp_chunk.strip()))
-                    temp_chunk = word
-            if temp_chunk:
-                chunks.append(ensure_punctuation(temp_chunk.strip()))
+                    if buf:
+                        chunks.append(ensure_punctuation(" ".join(buf)))
+                    buf = [word]
+                    buf_len = len(word)
+            if buf:
+                chunks.append(ensure_punctuation(" ".join(buf)))
     
     return chunks
 
 
+def concatenate_audio(chunks):
+    """Join per-chunk audio into one array, skipping the copy for a single chunk."""
+    if len(chunks) == 1:
+        return chunks[0]
+    return np.concatenate(chunks, axis=-1)
+
+
+def float_to_pcm16(audio):
+    """Convert float audio in [-1, 1] to int16 PCM, clipping out-of-range samples."""
+    scaled = np.multiply(audio, 32767.0, dtype=np.float32)
+    np.clip(scaled, -32768.0, 32767.0, out=scaled)
+    # Round and narrow to int16 in the same pass
+    pcm = np.empty(scaled.shape, dtype=np.int16)
+    np.rint(scaled, out=pcm, casting="unsafe")
+    return pcm
+
+
+def _model_cache_key(model_path):
+    """Short digest of a model file's path, size and modification time, so a
+    replaced file never reuses models derived from the old one."""
+    stat = os.stat(model_path)
+    key = f"{os.path.abspath(model_path)}:{stat.st_size}:{stat.st_mtime_ns}"
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_espeak():
+    """Point phonemizer at the bundled espeak-ng; imported on first use to keep
+    ``import kittentts`` fast."""
+    import espeakng_loader
+    from phonemizer.backend.espeak.wrapper import EspeakWrapper
+    EspeakWrapper.set_library(espeakng_loader.get_library_path())
+    os.environ['ESPEAK_DATA_PATH'] = espeakng_loader.get_data_path()
+
+
+class _SharedPhonemizer:
+    """An espeak backend shared by the model instances using one language.
+
+    espeak-ng keeps global state, so calls into a backend are serialized with
+    a lock; separate backends load separate copies of the library.
+    """
+
+    def __init__(self, language):
+        _load_espeak()
+        from phonemizer.backend import EspeakBackend
+
+        self.language = language
+        self.backend = EspeakBackend(
+            language=language, preserve_punctuation=True, with_stress=True
+        )
+        self.lock = threading.Lock()
+        self.users = 0
+
+    def phonemize(self, text, **kwargs):
+        with self.lock:
+            return self.backend.phonemize(text, **kwargs)
+
+
+_phonemizers = {}
+_phonemizers_lock = threading.Lock()
+
+
+def _acquire_phonemizer(language="en-us"):
+    """Return the shared espeak backend for a language, creating it on first use."""
+    with _phonemizers_lock:
+        shared = _phonemizers.get(language)
+        if shared is None:
+            shared = _phonemizers[language] = _SharedPhonemizer(language)
+        shared.users += 1
+        return shared
+
+
+def _release_phonemizer(shared):
+    """Drop one user of a shared backend, freeing it once nobody uses it."""
+    with _phonemizers_lock:
+        shared.users -= 1
+        if shared.users == 0 and _phonemizers.get(shared.language) is shared:
+            del _phonemizers[shared.language]
+
+
 class TextCleaner:
     def __init__(self, dummy=None):
         _pad = "$"
@@ -71,26 +185,48 @@ class TextCleaner:
 
         self.word_index_dictionary = dicts
 
+        # Codepoint -> index lookup table; the last entry (-1) catches unknown
+        # and out-of-range characters
+        lut_size = max(ord(c) for c in dicts) + 2
+        self._lut = np.full(lut_size, -1, dtype=np.int64)
+        for char, index in dicts.items():
+            self._lut[ord(char)] = index
+
+    def encode(self, text):
+        """Map text to symbol indexes as an int64 array, dropping unknown characters."""
+        # surrogatepass keeps lone surrogates encodable; the clamp below drops them
+        codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        indexes = self._lut[np.minimum(codes, len(self._lut) - 1)]
+        return indexes[indexes >= 0]
+
     def __call__(self, text):
-        indexes = []
-        for char in text:
-            try:
-                indexes.append(self.word_index_dictionary[char])
-            except KeyError:
-                pass
-        return indexes
+        return self.encode(text).tolist()
 
 
 class KittenTTS_1_Onnx:
-    def __init__(self, model_path="kitten_tts_nano_preview.onnx", voices_path="voices.npz", speed_priors={}, voice_aliases={}, backend=None):
+    def __init__(self, model_path="kitten_tts_nano_preview.onnx", voices_path="voices.npz", speed_priors={}, voice_aliases={}, backend=None,
+                 intra_op_num_threads=None, sess_options=None):
         """Initialize KittenTTS with model and voice data.
         
         Args:
             model_path: Path to the ONNX model file
             voices_path: Path to the voices NPZ file
+            intra_op_num_threads: Threads used inside each ONNX op; None uses
+                up to 4. Lower it when running several models in parallel.
+            sess_options: Custom onnxruntime.SessionOptions, used instead of the
+                defaults (intra_op_num_threads is then ignored)
         """
+        import onnxruntime as ort
+
         self.model_path = model_path
-        self.voices = np.load(voices_path) 
+        self._init_kwargs = dict(model_path=model_path, voices_path=voices_path, speed_priors=speed_priors,
+                                 voice_aliases=voice_aliases, backend=backend)
+        # Decode every voice up front and release the NPZ file. The style
+        # inputs are views into these arrays; copy before mutating them.
+        with np.load(voices_path) as voices:
+            self.voices = {name: np.ascontiguousarray(voices[name], dtype=np.float32) for name in voices.files}
+        for styles in self.voices.values():
+            styles.flags.writeable = False
         providers = []
         if backend == "cuda":
             providers = ["CUDAExecutionProvider"]
@@ -98,16 +234,24 @@ class KittenTTS_1_Onnx:
             providers = ["ROCMExecutionProvider"]
         elif backend == "cpu":
             providers = ["CPUExecutionProvider"]
+        elif backend == "auto":
+            available = ort.get_available_providers()
+            providers = [p for p in _AUTO_PROVIDERS if p in available]
         elif backend is None:
             providers = []
         else:
             raise ValueError("Unsupported backend")
         
-        self.session = ort.InferenceSession(model_path, providers=providers)
+        if sess_options is not None:
+            self.session = ort.InferenceSession(model_path, sess_options=sess_options, providers=providers)
+        elif backend in (None, "cpu"):
+            self.session = self._create_cached_cpu_session(model_path, intra_op_num_threads, providers)
+        else:
+            self.session = ort.InferenceSession(
+                model_path, sess_options=self._create_session_options(intra_op_num_threads), providers=providers
+            )
         
-        self.phonemizer = phonemizer.backend.EspeakBackend(
-            language="en-us", preserve_punctuation=True, with_stress=True
-        )
+        self.phonemizer = _acquire_phonemizer("en-us")
         self.text_cleaner = TextCleaner()
         self.speed_priors = speed_priors
         
@@ -120,9 +264,124 @@ class KittenTTS_1_Onnx:
         self.voice_aliases = voice_aliases
 
         self.preprocessor = TextPreprocessor(remove_punctuation=False)
+        self.sample_rate = 24000
+        self._warmed = False
+
+        # LRU cache of chunk text -> phonemes, the most expensive CPU-side step
+        self._phoneme_cache = OrderedDict()
+        self._phoneme_cache_size = 512
+        self._phoneme_cache_lock = threading.Lock()
+
+        # Worker processes for generate_batch(num_workers=...), created on first use
+        self._worker_pool = None
+        self._worker_pool_size = 0
     
-    def _prepare_inputs(self, text: str, voice: str, speed: float = 1.0) -> dict:
-        """Prepare ONNX model inputs from text and voice parameters."""
+    @staticmethod
+    def _create_session_options(intra_op_num_threads=None) -> "onnxruntime.SessionOptions":
+        """Build ONNX Runtime session options tuned for single-stream CPU throughput."""
+        import onnxruntime as ort
+
+        sess_options = ort.SessionOptions()
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        sess_options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        sess_options.inter_op_num_threads = 1
+        if intra_op_num_threads is None:
+            intra_op_num_threads = min(_DEFAULT_INTRA_OP_THREADS, os.cpu_count() or 1)
+        sess_options.intra_op_num_threads = intra_op_num_threads
+        sess_options.add_session_config_entry("session.intra_op.allow_spinning", "1")
+        sess_options.enable_cpu_mem_arena = True
+        sess_options.enable_mem_pattern = True
+        return sess_options
+
+    @classmethod
+    def _create_cached_cpu_session(cls, model_path, intra_op_num_threads, providers) -> "onnxruntime.InferenceSession":
+        """Create a CPU session, reusing a graph optimized by a previous run.
+
+        The first run saves the graph after the portable ORT_ENABLE_EXTENDED
+        passes to ~/.cache/kittentts; later runs load it, leaving only the
+        hardware-specific layout passes to do. The file name identifies the
+        source model by path, size and modification time, and includes the
+        ONNX Runtime version, since optimized graphs are tied to it. Any
+        failure falls back to optimizing in memory.
+        """
+        import onnxruntime as ort
+
+        stem = os.path.splitext(os.path.basename(model_path))[0]
+        optimized_path = os.path.join(
+            _CACHE_DIR, f"{stem}-{_model_cache_key(model_path)}.ort-{ort.__version__}.opt.onnx"
+        )
+        if os.path.exists(optimized_path):
+            sess_options = cls._create_session_options(intra_op_num_threads)
+            try:
+                return ort.InferenceSession(optimized_path, sess_options=sess_options, providers=providers)
+            except Exception:
+                logger.warning("Ignoring unreadable optimized model %s", optimized_path)
+
+        sess_options = cls._create_session_options(intra_op_num_threads)
+        sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+        # Write to a per-process temp file so concurrent loads never see a partial graph
+        tmp_path = f"{optimized_path}.{os.getpid()}.tmp"
+        sess_options.optimized_model_filepath = tmp_path
+        try:
+            os.makedirs(_CACHE_DIR, exist_ok=True)
+            session = ort.InferenceSession(model_path, sess_options=sess_options, providers=providers)
+        except Exception:
+            # e.g. a read-only cache directory
+            cls._remove_if_exists(tmp_path)
+            return ort.InferenceSession(
+                model_path, sess_options=cls._create_session_options(intra_op_num_threads), providers=providers
+            )
+        try:
+            os.replace(tmp_path, optimized_path)
+        except OSError:
+            cls._remove_if_exists(tmp_path)
+        return session
+
+    @staticmethod
+    def _remove_if_exists(path) -> None:
+        """Delete a leftover temp file, ignoring one that was never written."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.warning("Could not remove temporary file %s", path)
+
+    def _phonemize(self, texts: list) -> list:
+        """Phonemize a list of texts with a single espeak call, reusing cached results."""
+        results = [None] * len(texts)
+        misses = []
+        with self._phoneme_cache_lock:
+            for i, text in enumerate(texts):
+                phonemes = self._phoneme_cache.get(text)
+                if phonemes is None:
+                    misses.append(i)
+                else:
+                    self._phoneme_cache.move_to_end(text)
+                    results[i] = phonemes
+
+        if misses:
+            new_phonemes = self._get_phonemizer().phonemize([texts[i] for i in misses])
+            with self._phoneme_cache_lock:
+                for i, phonemes in zip(misses, new_phonemes):
+                    results[i] = phonemes
+                    self._phoneme_cache[texts[i]] = phonemes
+                while len(self._phoneme_cache) > self._phoneme_cache_size:
+                    self._phoneme_cache.popitem(last=False)
+        return results
+
+    def _get_phonemizer(self) -> _SharedPhonemizer:
+        """Return the espeak backend, acquiring it again if close() released it."""
+        with self._phoneme_cache_lock:
+            if self.phonemizer is None:
+                self.phonemizer = _acquire_phonemizer("en-us")
+            return self.phonemizer
+
+    def _prepare_inputs(self, text: str, voice: str, speed: float = 1.0, phonemes: str = None) -> dict:
+        """Prepare ONNX model inputs from text and voice parameters.
+
+        If ``phonemes`` is given, it is used instead of phonemizing ``text``.
+        """
         if voice in self.voice_aliases:
             voice = self.voice_aliases[voice]
 
@@ -133,21 +392,23 @@ class KittenTTS_1_Onnx:
             speed = speed * self.speed_priors[voice]
         
         # Phonemize the input text
-        phonemes_list = self.phonemizer.phonemize([text])
+        if phonemes is None:
+            phonemes = self._phonemize([text])[0]
         
         # Process phonemes to get token IDs
-        phonemes = basic_english_tokenize(phonemes_list[0])
+        phonemes = basic_english_tokenize(phonemes)
         phonemes = ' '.join(phonemes)
-        tokens = self.text_cleaner(phonemes)
-        
-        # Add start and end tokens
-        tokens.insert(0, 0)
-        tokens.append(10)
-        tokens.append(0)
+        tokens = self.text_cleaner.encode(phonemes)
         
-        input_ids = np.array([tokens], dtype=np.int64)
-        ref_id =  min(len(text), self.voices[voice].shape[0] - 1)
-        ref_s = self.voices[voice][ref_id:ref_id+1]
+        # Add start and end tokens: [0, *tokens, 10, 0]
+        input_ids = np.empty((1, tokens.shape[0] + 3), dtype=np.int64)
+        input_ids[0, 0] = 0
+        input_ids[0, 1:-2] = tokens
+        input_ids[0, -2] = 10
+        input_ids[0, -1] = 0
+        styles = self.voices[voice]
+        ref_id =  min(len(text), styles.shape[0] - 1)
+        ref_s = styles[ref_id:ref_id+1]
         
         return {
             "input_ids": input_ids,
@@ -155,58 +416,239 @@ class KittenTTS_1_Onnx:
             "speed": np.array([speed], dtype=np.float32),
         }
     
+    @property
+    def is_warm(self) -> bool:
+        """Whether warm_up() has already run on this model."""
+        return self._warmed
+
+    def warm_up(self, voice: str = "expr-voice-5-m") -> None:
+        """Run dummy syntheses so the first real request does not pay for
+        memory arena allocation and espeak initialization.
+
+        A short sentence warms up espeak, then a full-chunk-sized token
+        sequence grows the memory arena to its steady-state size.
+        Calling it again on an already warm model does nothing.
+        """
+        if self._warmed:
+            return
+        self.generate_single_chunk("Hello.", voice)
+        onnx_inputs = self._prepare_inputs("Hello.", voice, phonemes="")
+        input_ids = np.full((1, _WARM_UP_TOKENS), self.text_cleaner.word_index_dictionary["ə"], dtype=np.int64)
+        input_ids[0, 0] = input_ids[0, -1] = 0
+        onnx_inputs["input_ids"] = input_ids
+        self.session.run(None, onnx_inputs)
+        self._warmed = True
+
     def generate(self, text: str, voice: str = "expr-voice-5-m", speed: float = 1.0, clean_text: bool=True) -> np.ndarray:
-        out_chunks = []
-        if clean_text:
-            text = self.preprocessor(text)
-        for text_chunk in chunk_text(text):
-            out_chunks.append(self.generate_single_chunk(text_chunk, voice, speed))
-        return np.concatenate(out_chunks, axis=-1)
+        """Generate audio from text, phonemizing all of its chunks in one call."""
+        return self.generate_batch([text], voice=voice, speed=speed, clean_text=clean_text)[0]
 
-    def generate_stream(self, text: str, voice: str = "expr-voice-5-m", speed: float = 1.0, clean_text: bool = True):
+    def generate_stream(self, text: str, voice: str = "expr-voice-5-m", speed: float = 1.0, clean_text: bool = True,
+                        first_chunk_max_len: int = None):
         """Generate audio chunk-by-chunk as a generator.
 
+        The next chunk is phonemized in a background thread while the
+        current one runs through the model.
+
+        Args:
+            first_chunk_max_len: Optional smaller length limit for the first
+                chunk, to reduce the time until the first audio is ready
+
         Yields:
             numpy.ndarray: Audio data for each text chunk.
         """
         if clean_text:
             text = self.preprocessor(text)
-        for text_chunk in chunk_text(text):
-            yield self.generate_single_chunk(text_chunk, voice, speed)
+        chunks = chunk_text(text, first_max_len=first_chunk_max_len)
+        if not chunks:
+            return
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            next_phonemes = prefetcher.submit(self._phonemize, [chunks[0]])
+            for i, text_chunk in enumerate(chunks):
+                phonemes = next_phonemes.result()[0]
+                if i + 1 < len(chunks):
+                    next_phonemes = prefetcher.submit(self._phonemize, [chunks[i + 1]])
+                yield self.generate_single_chunk(text_chunk, voice, speed, phonemes=phonemes)
+
+    def generate_batch(self, texts: list, voice: str = "expr-voice-5-m", speed: float = 1.0, clean_text: bool = True,
+                       num_workers: int = None) -> list:
+        """Generate audio for several texts at once.
+
+        The chunks of all texts are phonemized in a single espeak call. The
+        model has no attention mask input, so inference still runs once per
+        chunk; padding chunks into one batch would synthesize the padding.
+
+        Args:
+            texts: List of input texts to synthesize
+            voice: Voice to use for synthesis
+            speed: Speech speed (1.0 = normal)
+            clean_text: If true, it will cleanup the text. Eg. replace numbers with words.
+            num_workers: If greater than 1, synthesize texts in that many worker
+                processes, each with its own session and a share of the CPU cores
+
+        Returns:
+            List of audio arrays, one per input text
+        """
+        if clean_text:
+            texts = [self.preprocessor(text) for text in texts]
+        if num_workers is not None and num_workers > 1 and len(texts) > 1:
+            return self._generate_batch_parallel(texts, voice, speed, num_workers)
+        chunks_per_text = [chunk_text(text) for text in texts]
+        all_chunks = [chunk for chunks in chunks_per_text for chunk in chunks]
+        all_phonemes = iter(self._phonemize(all_chunks)) if all_chunks else iter(())
+
+        results = []
+        for chunks in chunks_per_text:
+            phonemized = [(chunk, next(all_phonemes)) for chunk in chunks]
+            results.append(self.generate_from_phonemes(phonemized, voice, speed))
+        return results
+
+    def phonemize(self, text: str, clean_text: bool = True) -> list:
+        """Split text into chunks and phonemize them, for reuse with generate_from_phonemes().
+
+        Returns:
+            List of (text_chunk, phonemes) pairs
+        """
+        if clean_text:
+            text = self.preprocessor(text)
+        chunks = chunk_text(text)
+        return list(zip(chunks, self._phonemize(chunks))) if chunks else []
+
+    def generate_from_phonemes(self, phonemized: list, voice: str = "expr-voice-5-m", speed: float = 1.0) -> np.ndarray:
+        """Generate audio from the output of phonemize(), skipping the espeak step."""
+        out_chunks = [
+            self.generate_single_chunk(chunk, voice, speed, phonemes=phonemes)
+            for chunk, phonemes in phonemized
+        ]
+        return concatenate_audio(out_chunks)
+
+    def _generate_batch_parallel(self, texts: list, voice: str, speed: float, num_workers: int) -> list:
+        """Synthesize already cleaned texts in worker processes, preserving order."""
+        jobs = [(text, voice, speed) for text in texts]
+        try:
+            return list(self._get_worker_pool(num_workers).map(_generate_in_worker, jobs))
+        except BrokenProcessPool:
+            # A worker died (e.g. killed for memory); start a fresh pool and retry
+            # once. The retry re-runs every job, so finished texts are recomputed.
+            self._shutdown_worker_pool()
+            return list(self._get_worker_pool(num_workers).map(_generate_in_worker, jobs))
+
+    def _get_worker_pool(self, num_workers: int) -> ProcessPoolExecutor:
+        """Return the worker pool, reusing the loaded worker models across calls."""
+        if self._worker_pool is None or self._worker_pool_size != num_workers:
+            self._shutdown_worker_pool()
+            threads_per_worker = max(1, (os.cpu_count() or 1) // num_workers)
+            init_kwargs = dict(self._init_kwargs, intra_op_num_threads=threads_per_worker)
+            # Spawn rather than fork: forking a process that runs ORT and espeak
+            # threads can copy a held lock into the child, which then deadlocks
+            self._worker_pool = ProcessPoolExecutor(
+                max_workers=num_workers, mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker, initargs=(init_kwargs,)
+            )
+            self._worker_pool_size = num_workers
+        return self._worker_pool
+
+    def close(self) -> None:
+        """Shut down worker processes and release the shared espeak backend.
+
+        The model stays usable; both are recreated when next needed.
+        """
+        self._shutdown_worker_pool()
+        with self._phoneme_cache_lock:
+            if self.phonemizer is not None:
+                _release_phonemizer(self.phonemizer)
+                self.phonemizer = None
 
-    def generate_single_chunk(self, text: str, voice: str = "expr-voice-5-m", speed: float = 1.0) -> np.ndarray:
+    def _shutdown_worker_pool(self) -> None:
+        """Shut down worker processes started by generate_batch(num_workers=...)."""
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
+            self._worker_pool = None
+            self._worker_pool_size = 0
+
+    def generate_single_chunk(self, text: str, voice: str = "expr-voice-5-m", speed: float = 1.0, phonemes: str = None) -> np.ndarray:
         """Synthesize speech from text.
         
         Args:
             text: Input text to synthesize
             voice: Voice to use for synthesis
             speed: Speech speed (1.0 = normal)
+            phonemes: Pre-computed phonemes for ``text``, skips phonemization
             
         Returns:
             Audio data as numpy array
         """
-        onnx_inputs = self._prepare_inputs(text, voice, speed)
+        onnx_inputs = self._prepare_inputs(text, voice, speed, phonemes=phonemes)
         
         outputs = self.session.run(None, onnx_inputs)
         
-        # Trim audio
+        # Trim audio; everything downstream assumes float32
         audio = outputs[0][..., :-5000]
+        if audio.dtype != np.float32:
+            audio = audio.astype(np.float32)
 
         return audio
     
     def generate_to_file(self, text: str, output_path: str, voice: str = "expr-voice-5-m", 
-                          speed: float = 1.0, sample_rate: int = 24000, clean_text: bool=True) -> None:
+                          speed: float = 1.0, sample_rate: int = None, clean_text: bool=True) -> None:
         """Synthesize speech and save to file.
         
         Args:
             text: Input text to synthesize
-            output_path: Path to save the audio file
+            output_path: Path to save the audio file (str or path-like)
             voice: Voice to use for synthesis
             speed: Speech speed (1.0 = normal)
-            sample_rate: Audio sample rate
+            sample_rate: Audio sample rate (defaults to the model's sample rate)
             clean_text: If true, it will cleanup the text. Eg. replace numbers with words.
         """
-        audio = self.generate(text, voice, speed, clean_text=clean_text)
-        sf.write(output_path, audio, sample_rate)
-        print(f"Audio saved to {output_path}")
+        import soundfile as sf
+
+        if clean_text:
+            text = self.preprocessor(text)
+        chunks = chunk_text(text)
+        if not chunks:
+            raise ValueError("No text to synthesize")
+        if sample_rate is None:
+            sample_rate = self.sample_rate
+        output_path = os.fspath(output_path)
+        root, ext = os.path.splitext(output_path)
+        # Quantize to int16 ourselves where the format stores 16-bit PCM; other
+        # formats (e.g. Ogg Vorbis) get the float audio and their default subtype
+        file_format = ext[1:].upper()
+        to_pcm16 = bool(file_format) and sf.check_format(file_format, "PCM_16")
+
+        # Phonemize all chunks in one espeak call, then write each chunk as it is
+        # synthesized instead of holding the whole waveform. The temporary file
+        # only replaces output_path once every chunk has been written. Its name is
+        # unique per writer and keeps the extension, so the format is detected
+        # the same way as for output_path.
+        all_phonemes = self._phonemize(chunks)
+        tmp_path = f"{root}.{os.getpid()}.{threading.get_ident()}.tmp{ext}"
+        try:
+            with sf.SoundFile(tmp_path, mode="w", samplerate=sample_rate, channels=1,
+                              subtype="PCM_16" if to_pcm16 else None) as f:
+                for chunk, phonemes in zip(chunks, all_phonemes):
+                    audio = self.generate_single_chunk(chunk, voice, speed, phonemes=phonemes).reshape(-1)
+                    f.write(float_to_pcm16(audio) if to_pcm16 else audio)
+            os.replace(tmp_path, output_path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        logger.info("Audio saved to %s", output_path)
+
+
+_worker_model = None
+
+
+def _init_worker(init_kwargs):
+    """Load one model per worker process for generate_batch(num_workers=...)."""
+    global _worker_model
+    _worker_model = KittenTTS_1_Onnx(**init_kwargs)
+
 
+def _generate_in_worker(args):
+    text, voice, speed = args
+    return _worker_model.generate(text, voice=voice, speed=speed, clean_text=False)